@@ -43,4 +43,18 @@ CONFIG = {
     "cyber_mode": False,
     "theme_cycle_enabled": True,
     "theme_cycle_interval": 10.0, # Seconds
+    "drilldown_target": None,  # PID or process-name regex; None disables the panel
+    "drilldown_workers": 8,
+    "drilldown_max_procs": 256,  # Cap on processes tracked in the tree
+    # Cap on queued/running jobs, each sampling all due stats of one process.
+    # None means 4 x drilldown_workers; when the tree needs more, processes are
+    # served oldest-first and their sampling interval stretches.
+    "drilldown_max_inflight": None,
+    "drilldown_rate_limits": {  # Minimum seconds between samples, per stat
+        "tree": 2.0,
+        "threads": 1.0,
+        "fds": 2.0,
+        "io": 1.0,
+        "ctx": 1.0,
+    },
 }
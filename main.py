@@ -1,5 +1,6 @@
 import time
 import sys
+import argparse
 import collections
 from rich.live import Live
 from rich.layout import Layout
@@ -19,10 +20,20 @@ class AppState:
         self.last_theme_switch = time.time()
         self.themes = list(THEMES.keys())
         self.current_theme_idx = 0
+        self.drilldown = None
+        if CONFIG["drilldown_target"]:
+            self.drilldown = metrics.ProcessTreeProbe(
+                str(CONFIG["drilldown_target"]),
+                workers=CONFIG["drilldown_workers"],
+                rate_limits=CONFIG["drilldown_rate_limits"],
+                max_procs=CONFIG["drilldown_max_procs"],
+                max_inflight=CONFIG["drilldown_max_inflight"]
+            )
 
-def make_layout() -> Layout:
+def make_layout(drilldown: bool = False) -> Layout:
     """
     Define the layout grid.
+    If drilldown is set, the left column gets an extra process-tree panel.
     """
     layout = Layout(name="root")
     
@@ -38,10 +49,17 @@ def make_layout() -> Layout:
         Layout(name="right_col", ratio=1)
     )
     
-    layout["left_col"].split(
-        Layout(name="cpu", ratio=2),
-        Layout(name="processes", ratio=3)
-    )
+    if drilldown:
+        layout["left_col"].split(
+            Layout(name="cpu", ratio=2),
+            Layout(name="processes", ratio=2),
+            Layout(name="drilldown", ratio=3)
+        )
+    else:
+        layout["left_col"].split(
+            Layout(name="cpu", ratio=2),
+            Layout(name="processes", ratio=3)
+        )
     
     layout["right_col"].split(
         Layout(name="memory", ratio=2),
@@ -124,6 +142,10 @@ def update_layout(layout: Layout, state: AppState) -> None:
     layout["processes"].update(proc_panel)
     layout["gpu"].update(gpu_panel)
     
+    # Drill-down: poll() only schedules work on the pool; the table is capped to the rows that fit
+    if state.drilldown:
+        layout["drilldown"].update(render.generate_drilldown_table(state.drilldown.poll()))
+    
     # Sensors Slot: Show Temps. If Battery exists, show it instead of Disk maybe?
     # Or just put Temp in Sensors slot.
     layout["sensors"].update(temp_panel)
@@ -148,10 +170,20 @@ def update_layout(layout: Layout, state: AppState) -> None:
     
     layout["footer"].update(Panel(footer_content, style="cyan", title="NETWORK_FLOW"))
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="System monitoring as performance art.")
+    parser.add_argument(
+        "target", nargs="?", default=CONFIG["drilldown_target"],
+        help="PID or process-name regex to show in the drill-down panel"
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    CONFIG["drilldown_target"] = args.target
     console = Console()
-    layout = make_layout()
     state = AppState()
+    layout = make_layout(drilldown=state.drilldown is not None)
     
     try:
         with Live(layout, refresh_per_second=4, screen=True) as live:
@@ -164,6 +196,9 @@ def main():
     except Exception as e:
         console.print(f"[bold red]CRITICAL ERROR: {e}[/bold red]")
         sys.exit(1)
+    finally:
+        if state.drilldown:
+            state.drilldown.close()
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,12 @@
 import psutil
+import collections
+import queue
+import re
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import Future
 import xml.etree.ElementTree as ET
 from typing import List, Tuple, Dict, Any, Optional
 
@@ -132,3 +138,245 @@ def get_battery_status() -> Optional[Dict[str, Any]]:
             "secsleft": batt.secsleft
         }
     return None
+
+DRILLDOWN_STATS = ("threads", "fds", "io", "ctx")
+
+def resolve_process_tree(target: str, max_procs: int = 256) -> Dict[psutil.Process, str]:
+    """
+    Returns {process: name} for every process in the tree rooted at target.
+    target is either a PID or a regex matched against process names.
+    psutil.Process hashes on (pid, create_time), so a reused PID is a new key.
+    """
+    # One pass over the process table; children(recursive=True) would rescan
+    # it for every root, which adds up when a name regex matches hundreds
+    procs = {}
+    children = collections.defaultdict(list)
+    for p in psutil.process_iter(['ppid', 'name']):
+        procs[p.pid] = p
+        children[p.info['ppid']].append(p.pid)
+
+    if target.isdigit():
+        roots = [int(target)] if int(target) in procs else []
+    else:
+        try:
+            pattern = re.compile(target)
+        except re.error:
+            pattern = re.compile(re.escape(target))
+        roots = [pid for pid, p in procs.items() if p.info['name'] and pattern.search(p.info['name'])]
+
+    tree = {}
+    stack = list(reversed(roots))
+    while stack and len(tree) < max_procs:
+        pid = stack.pop()
+        p = procs[pid]
+        if p in tree:
+            continue
+        tree[p] = p.info['name'] or ""
+        stack.extend(reversed(children[pid]))
+    return tree
+
+class _DaemonPool:
+    """
+    Minimal futures-based worker pool running on daemon threads.
+    ThreadPoolExecutor joins its workers at interpreter exit, so a psutil
+    call stuck on a hung /proc entry would block Ctrl-C; daemon workers don't.
+    """
+    def __init__(self, workers: int):
+        self._jobs = queue.SimpleQueue()
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"drilldown-{i}", daemon=True).start()
+        self._workers = workers
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def shutdown(self) -> None:
+        # Cancel queued jobs, then wake each worker with a stop sentinel
+        while True:
+            try:
+                item = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        for _ in range(self._workers):
+            self._jobs.put(None)
+
+    def _work(self) -> None:
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+class ProcessTreeProbe:
+    """
+    Collects per-thread CPU, open FDs, IO rates and context switches for
+    every process in a tree, using a worker pool.
+
+    poll() never blocks: it schedules one job per process covering the stats
+    whose rate limit has expired, oldest first, keeps at most max_inflight
+    jobs queued, and returns whatever results have arrived so far.
+    """
+    def __init__(self, target: str, workers: int = 8, rate_limits: Optional[Dict[str, float]] = None,
+                 max_procs: int = 256, max_inflight: Optional[int] = None):
+        self.target = target
+        self.rate_limits = rate_limits or {}
+        self.max_procs = max_procs
+        # A few queued jobs per worker keeps them busy; oldest-first scheduling
+        # rotates the rest of the tree through the cap
+        self.max_inflight = max_inflight or 4 * workers
+        # io_counters() doesn't exist on every platform (e.g. macOS)
+        self._stats = tuple(
+            stat for stat in DRILLDOWN_STATS
+            if stat != "io" or hasattr(psutil.Process, "io_counters")
+        )
+        self._pool = _DaemonPool(workers)
+        self._lock = threading.Lock()
+        self._procs = {}     # psutil.Process -> name, refreshed by the "tree" job
+        self._results = {}   # psutil.Process -> {stat: value}
+        self._samples = {}   # (process, stat) -> (timestamp, raw counters) for rates
+        self._last_run = {}  # "tree" or (process, stat) -> monotonic time last scheduled
+        self._inflight = set()
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        Schedules due collection jobs and returns a snapshot of the results.
+        """
+        now = time.monotonic()
+        jobs = []
+        with self._lock:
+            if "tree" not in self._inflight and self._due("tree", now):
+                self._inflight.add("tree")
+                self._last_run["tree"] = now
+                jobs.append(("tree", resolve_process_tree, (self.target, self.max_procs)))
+
+            due = []
+            for proc in self._procs:
+                if proc in self._inflight:
+                    continue
+                stats = [stat for stat in self._stats if self._due((proc, stat), now)]
+                if stats:
+                    oldest = min(self._last_run.get((proc, stat), float("-inf")) for stat in stats)
+                    due.append((oldest, proc, stats))
+
+            # Longest-waiting processes first, so a full queue rotates through the whole tree
+            due.sort(key=lambda job: job[0])
+            room = self.max_inflight - len(self._inflight - {"tree"})
+            for _, proc, stats in due[:max(room, 0)]:
+                self._inflight.add(proc)
+                for stat in stats:
+                    self._last_run[(proc, stat)] = now
+                jobs.append((proc, self._collect, (proc, stats)))
+
+        for key, fn, args in jobs:
+            future = self._pool.submit(fn, *args)
+            future.add_done_callback(lambda f, key=key: self._finish(key, f))
+
+        with self._lock:
+            processes = [
+                dict(self._results.get(proc, {}), pid=proc.pid, name=name)
+                for proc, name in self._procs.items()
+            ]
+            pending = len(self._inflight)
+        return {"target": self.target, "processes": processes, "pending": pending}
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def _due(self, key: Any, now: float) -> bool:
+        stat = key if key == "tree" else key[1]
+        interval = self.rate_limits.get(stat, 1.0)
+        return now - self._last_run.get(key, float("-inf")) >= interval
+
+    def _finish(self, key: Any, future: Future) -> None:
+        try:
+            value = future.result()
+            gone = False
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            value = None
+            gone = True
+        except Exception:
+            # Tree lookup failed, access denied, or job cancelled on close
+            value = None
+            gone = False
+
+        with self._lock:
+            self._inflight.discard(key)
+            if key == "tree":
+                if value is not None:
+                    self._procs = value
+                    self._prune()
+            elif gone:
+                self._procs.pop(key, None)
+                self._prune()
+            elif value is not None and key in self._procs:
+                self._results.setdefault(key, {}).update(value)
+
+    def _prune(self) -> None:
+        # Forget state for processes that left the tree; caller holds the lock
+        live = self._procs
+        self._results = {proc: r for proc, r in self._results.items() if proc in live}
+        self._samples = {k: v for k, v in self._samples.items() if k[0] in live}
+        self._last_run = {k: v for k, v in self._last_run.items() if k == "tree" or k[0] in live}
+
+    def _collect(self, proc: psutil.Process, stats: List[str]) -> Dict[str, Any]:
+        values = {}
+        with proc.oneshot():
+            for stat in stats:
+                try:
+                    values[stat] = self._collect_stat(proc, stat)
+                except (psutil.AccessDenied, NotImplementedError):
+                    # Not readable for this process
+                    continue
+        # Catches the PID being reused by another process while we were reading
+        if not proc.is_running():
+            raise psutil.NoSuchProcess(proc.pid)
+        return values
+
+    def _collect_stat(self, proc: psutil.Process, stat: str) -> Any:
+        if stat == "fds":
+            return proc.num_fds() if hasattr(proc, "num_fds") else proc.num_handles()
+
+        if stat == "threads":
+            raw = {t.id: t.user_time + t.system_time for t in proc.threads()}
+        elif stat == "io":
+            io = proc.io_counters()
+            raw = (io.read_bytes, io.write_bytes)
+        else:
+            ctx = proc.num_ctx_switches()
+            raw = ctx.voluntary + ctx.involuntary
+
+        now = time.monotonic()
+        with self._lock:
+            prev = self._samples.get((proc, stat))
+            self._samples[(proc, stat)] = (now, raw)
+
+        # Rates need two samples; report None until the second one lands
+        elapsed = now - prev[0] if prev else 0.0
+        if stat == "threads":
+            hot_tid, hot_cpu, total_cpu = None, None, None
+            if elapsed > 0:
+                usage = {tid: (t - prev[1][tid]) / elapsed * 100.0
+                         for tid, t in raw.items() if tid in prev[1]}
+                total_cpu = sum(usage.values())
+                if usage:
+                    hot_tid = max(usage, key=usage.get)
+                    hot_cpu = usage[hot_tid]
+            return {"count": len(raw), "cpu": total_cpu, "hot_tid": hot_tid, "hot_cpu": hot_cpu}
+        if stat == "io":
+            if elapsed <= 0:
+                return {"read": None, "write": None}
+            return {
+                "read": (raw[0] - prev[1][0]) / elapsed,
+                "write": (raw[1] - prev[1][1]) / elapsed
+            }
+        return (raw - prev[1]) / elapsed if elapsed > 0 else None
@@ -180,6 +180,60 @@ def generate_process_table(processes: List[Dict[str, Any]]) -> Panel:
         
     return Panel(table, title="TOP PROCS", border_style="magenta")
 
+def generate_drilldown_table(snapshot: Dict[str, Any], n: int = 15) -> Panel:
+    """
+    Generates a detail table for the n busiest processes in the drill-down tree.
+    Stats that have not arrived yet (or need a second sample) show as "-".
+    """
+    def fmt(value: Optional[float], scale: float = 1.0, spec: str = ".1f") -> str:
+        if value is None:
+            return "-"
+        return format(value / scale if scale != 1.0 else value, spec)
+
+    table = Table(box=box.SIMPLE, show_header=True, header_style="bold magenta")
+    table.add_column("PID", style="cyan", width=6)
+    table.add_column("NAME", style="white")
+    table.add_column("CPU%", style="green", justify="right")
+    table.add_column("THR", style="white", justify="right")
+    table.add_column("HOT TID:CPU%", style="red", justify="right")
+    table.add_column("FDS", style="yellow", justify="right")
+    table.add_column("R KB/s", style="cyan", justify="right")
+    table.add_column("W KB/s", style="magenta", justify="right")
+    table.add_column("CSW/s", style="blue", justify="right")
+
+    def fmt_hot(threads: Dict[str, Any]) -> str:
+        # TID alongside its CPU so it can be matched against a thread dump
+        if threads.get("hot_tid") is None:
+            return "-"
+        return f"{threads['hot_tid']}:{threads['hot_cpu']:.1f}"
+
+    processes = sorted(
+        snapshot["processes"],
+        key=lambda p: p.get("threads", {}).get("cpu") or 0.0,
+        reverse=True
+    )
+
+    for proc in processes[:n]:
+        threads = proc.get("threads", {})
+        io = proc.get("io", {})
+        table.add_row(
+            str(proc["pid"]),
+            proc["name"][:15],
+            fmt(threads.get("cpu")),
+            fmt(threads.get("count"), spec="d"),
+            fmt_hot(threads),
+            fmt(proc.get("fds"), spec="d"),
+            fmt(io.get("read"), 1024),
+            fmt(io.get("write"), 1024),
+            fmt(proc.get("ctx"), spec=".0f")
+        )
+
+    shown = f"{len(processes)} PROCS"
+    if len(processes) > n:
+        shown += f" (top {n} shown)"
+    title = f"DRILLDOWN [ {snapshot['target']} :: {shown} :: {snapshot['pending']} PENDING ]"
+    return Panel(table, title=title, border_style="red")
+
 def generate_net_sparkline(history: List[float]) -> Text:
     """
     Generates a sparkline graph for network activity.
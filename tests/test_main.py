@@ -0,0 +1,12 @@
+import pytest
+
+import main
+
+def test_make_layout_without_drilldown():
+    layout = main.make_layout()
+    with pytest.raises(KeyError):
+        layout["drilldown"]
+
+def test_make_layout_with_drilldown():
+    layout = main.make_layout(drilldown=True)
+    assert [child.name for child in layout["left_col"].children] == ["cpu", "processes", "drilldown"]
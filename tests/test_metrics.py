@@ -0,0 +1,135 @@
+import os
+import re
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+import metrics
+
+# Parent process that spawns N children running the given command and reaps them as they exit
+SPAWN_TREE = (
+    "import subprocess, sys\n"
+    "children = [subprocess.Popen(sys.argv[2:]) for _ in range(int(sys.argv[1]))]\n"
+    "for child in children: child.wait()\n"
+)
+
+FAST_LIMITS = {"tree": 0.2, "threads": 0.1, "fds": 0.1, "io": 0.1, "ctx": 0.1}
+
+@pytest.fixture
+def process_tree(tmp_path):
+    def spawn(n, name=None):
+        python, child = sys.executable, ["sleep", "60"]
+        if name:
+            # Process names come from the executable's basename, so a symlinked
+            # interpreter gives the parent and every child a unique name
+            python = str(tmp_path / name)
+            os.symlink(sys.executable, python)
+            child = [python, "-c", "import time; time.sleep(60)"]
+        parent = subprocess.Popen([python, "-c", SPAWN_TREE, str(n)] + child)
+        proc = psutil.Process(parent.pid)
+        deadline = time.monotonic() + 10
+        while len(proc.children()) < n:
+            assert time.monotonic() < deadline, "child tree did not start"
+            time.sleep(0.05)
+        spawned.append(proc)
+        return proc
+
+    spawned = []
+    yield spawn
+    for proc in spawned:
+        for child in proc.children(recursive=True):
+            child.kill()
+        proc.kill()
+
+@pytest.fixture
+def probe_factory():
+    probes = []
+
+    def make(target, **kwargs):
+        probe = metrics.ProcessTreeProbe(str(target), **kwargs)
+        probes.append(probe)
+        return probe
+
+    yield make
+    for probe in probes:
+        probe.close()
+
+def poll_until(probe, predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snapshot = probe.poll()
+        if predicate(snapshot):
+            return snapshot
+        time.sleep(0.05)
+    pytest.fail(f"condition not met within {timeout}s: {probe.poll()}")
+
+def has_all_stats(proc):
+    return all(stat in proc for stat in metrics.DRILLDOWN_STATS)
+
+def test_resolve_process_tree_by_pid(process_tree):
+    parent = process_tree(3)
+    tree = metrics.resolve_process_tree(str(parent.pid))
+    assert {p.pid for p in tree} == {parent.pid} | {c.pid for c in parent.children()}
+
+def test_resolve_process_tree_by_name_regex(process_tree):
+    # The parent and all its children match, so every child is both a root
+    # and a descendant of another root
+    name = f"gtprobe-{os.getpid() % 100000}"
+    parent = process_tree(3, name=name)
+    tree = metrics.resolve_process_tree(f"^{re.escape(name)}$")
+    pids = [p.pid for p in tree]
+    assert len(pids) == len(set(pids))
+    assert set(pids) == {parent.pid} | {c.pid for c in parent.children()}
+    assert set(tree.values()) == {name}
+
+def test_every_member_gets_stats_with_small_cap(process_tree, probe_factory):
+    parent = process_tree(40)
+    # A cap far below the tree size must still rotate through every process
+    probe = probe_factory(parent.pid, workers=2, rate_limits=FAST_LIMITS, max_inflight=4)
+    snapshot = poll_until(
+        probe,
+        lambda s: len(s["processes"]) == 41 and all(has_all_stats(p) for p in s["processes"])
+    )
+    assert snapshot["pending"] <= 4 + 1  # capped jobs plus the tree refresh
+
+def test_rates_are_none_until_second_sample(process_tree, probe_factory):
+    parent = process_tree(2)
+    slow = dict(FAST_LIMITS, threads=60, fds=60, io=60, ctx=60)
+    probe = probe_factory(parent.pid, rate_limits=slow)
+    snapshot = poll_until(
+        probe,
+        lambda s: s["processes"] and all(has_all_stats(p) for p in s["processes"])
+    )
+    for proc in snapshot["processes"]:
+        assert proc["ctx"] is None
+        assert proc["io"] == {"read": None, "write": None}
+        assert proc["threads"]["cpu"] is None
+        assert proc["threads"]["count"] >= 1
+        assert proc["fds"] >= 0
+
+    probe.rate_limits = FAST_LIMITS
+    poll_until(
+        probe,
+        lambda s: all(p["ctx"] is not None and p["io"]["read"] is not None
+                      and p["threads"]["cpu"] is not None for p in s["processes"])
+    )
+
+def test_exited_child_is_pruned(process_tree, probe_factory):
+    parent = process_tree(3)
+    probe = probe_factory(parent.pid, rate_limits=FAST_LIMITS)
+    poll_until(
+        probe,
+        lambda s: len(s["processes"]) == 4 and all(has_all_stats(p) for p in s["processes"])
+    )
+
+    victim = parent.children()[0]
+    victim.kill()
+    snapshot = poll_until(probe, lambda s: victim.pid not in {p["pid"] for p in s["processes"]})
+
+    survivors = {parent.pid} | {c.pid for c in parent.children()} - {victim.pid}
+    assert [p["pid"] for p in snapshot["processes"]].count(victim.pid) == 0
+    assert {p["pid"] for p in snapshot["processes"]} == survivors
+    assert all(has_all_stats(p) for p in snapshot["processes"])
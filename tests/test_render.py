@@ -0,0 +1,38 @@
+import io
+import re
+
+from rich.console import Console
+
+import render
+
+def render_text(renderable) -> str:
+    console = Console(file=io.StringIO(), width=160)
+    console.print(renderable)
+    return console.file.getvalue()
+
+def test_drilldown_table_handles_missing_and_none_stats():
+    processes = [
+        # Only the first sample has landed: rates are None
+        {"pid": 1, "name": "first-sample", "fds": 4,
+         "threads": {"count": 2, "cpu": None, "hot_tid": None, "hot_cpu": None},
+         "io": {"read": None, "write": None}, "ctx": None},
+        # No stats have arrived yet
+        {"pid": 2, "name": "no-stats"},
+        {"pid": 3, "name": "busy", "fds": 12,
+         "threads": {"count": 500, "cpu": 180.0, "hot_tid": 4242, "hot_cpu": 87.0},
+         "io": {"read": 2048.0, "write": 1024.0}, "ctx": 31.0},
+    ]
+    processes += [{"pid": 100 + i, "name": f"idle-{i}"} for i in range(20)]
+    panel = render.generate_drilldown_table({"target": "java", "processes": processes, "pending": 5}, n=15)
+
+    assert "23 PROCS (top 15 shown)" in panel.title
+    text = render_text(panel)
+    assert "4242:87.0" in text
+    # The busiest process sorts first, and rows past n are dropped
+    assert text.index("busy") < text.index("first-sample")
+    assert len(re.findall(r"idle-\d+", text)) == 15 - 3
+
+def test_drilldown_table_title_without_truncation():
+    panel = render.generate_drilldown_table({"target": "1234", "processes": [], "pending": 0})
+    assert "0 PROCS ::" in panel.title
+    assert "shown" not in panel.title